@@ -1,6 +1,14 @@
 """Json schema to pydantic."""
 
-from jsonschema_pydantic_converter.create_type_adapter import create_type_adapter
+from jsonschema_pydantic_converter.create_type_adapter import (
+    create_type_adapter,
+    get_type_adapter,
+)
 from jsonschema_pydantic_converter.transform import transform, transform_with_modules
 
-__all__ = ["create_type_adapter", "transform", "transform_with_modules"]
+__all__ = [
+    "create_type_adapter",
+    "get_type_adapter",
+    "transform",
+    "transform_with_modules",
+]
@@ -1,65 +1,302 @@
 """Utility functions for JSON Schema processing."""
 
+import json
+import math
 import re
-from typing import Any
+import sys
+from functools import lru_cache
+from typing import Any, Iterator
 
+try:
+    import orjson
 
-def collect_definitions(
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    _HAS_ORJSON = False
+
+_INVALID_IDENTIFIER_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+# Digit runs long enough to hold an integer outside orjson's 64-bit range
+_LONG_DIGIT_RUN = re.compile(r"[0-9]{19}")
+_LONG_DIGIT_RUN_BYTES = re.compile(rb"[0-9]{19}")
+
+# Scalar types besides float and None that JSON encodes exactly. Compared by
+# exact type, as e.g. str enums encode like plain strings.
+_JSON_SCALAR_TYPES: frozenset[type] = frozenset((str, int, bool))
+
+# Keywords that appear in local $ref paths but are not part of a definition name
+_REF_KEYWORDS: frozenset[str] = frozenset(("$defs", "definitions"))
+
+
+def _definition_entries(
+    schema_dict: dict[str, Any], parts: tuple[str, ...]
+) -> list[tuple[tuple[str, ...], Any]]:
+    """Return the ``(path_parts, definition)`` pairs declared directly on a schema."""
+    current_defs = schema_dict.get("$defs")
+    if current_defs is None:
+        current_defs = schema_dict.get("definitions")
+        if current_defs is None:
+            return []
+
+    return [
+        ((*parts, def_name), definition)
+        for def_name, definition in current_defs.items()
+    ]
+
+
+def iter_definitions(
     schema_dict: dict[str, Any], path: str = ""
-) -> dict[str, dict[str, Any]]:
-    """Recursively collect all $defs/$definitions from schema.
+) -> Iterator[tuple[str, Any]]:
+    """Iterate over all $defs/$definitions in schema, including nested ones.
+
+    Nested definitions are walked with an explicit stack rather than by
+    recursion. Entries are yielded in depth-first order: each definition is
+    followed by its own nested definitions before its next sibling. Being a
+    generator, callers can process each definition as it is found without
+    materializing the full set first.
+
+    A definition that is also one of its own ancestors (which can only happen
+    for schemas built in Python, not parsed from JSON) is yielded, but its
+    nested definitions are not walked again. Definition objects shared
+    between unrelated paths are still yielded once per path.
 
     Args:
         schema_dict: The schema dictionary to collect definitions from.
         path: The current path in the schema hierarchy.
 
+    Yields:
+        Tuples of the full definition path and its schema.
+    """
+    # Paths are carried as tuples of names and joined only once per entry, and
+    # each entry carries the ids of the schemas enclosing it.
+    # Reversed so that popping from the end yields entries in declaration order
+    root: tuple[int, ...] = (id(schema_dict),)
+    stack = [
+        (parts, definition, root)
+        for parts, definition in reversed(
+            _definition_entries(schema_dict, (path,) if path else ())
+        )
+    ]
+    while stack:
+        parts, definition, ancestors = stack.pop()
+        yield "/".join(parts), definition
+
+        if isinstance(definition, dict) and id(definition) not in ancestors:
+            nested = (*ancestors, id(definition))
+            stack.extend(
+                (nested_parts, nested_definition, nested)
+                for nested_parts, nested_definition in reversed(
+                    _definition_entries(definition, parts)
+                )
+            )
+
+
+def _decode_json(text: str | bytes) -> Any:
+    """Decode JSON text, with orjson when it is installed.
+
+    orjson is only used where it gives the same result as the standard
+    library: text it rejects (such as ``NaN`` literals or numbers too large
+    for a float) is decoded again with json, and text containing a run of 19
+    or more digits, which may hold an integer beyond 64 bits that orjson
+    would return as a float, goes to json directly.
+    """
+    if _HAS_ORJSON:
+        if isinstance(text, bytes):
+            has_long_digits = _LONG_DIGIT_RUN_BYTES.search(text) is not None
+        else:
+            has_long_digits = _LONG_DIGIT_RUN.search(text) is not None
+        if not has_long_digits:
+            try:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(text)
+
+
+def load_schema(
+    schema: dict[str, Any] | bool | str | bytes,
+) -> dict[str, Any] | bool:
+    """Decode a schema passed as JSON text; return other schemas unchanged.
+
+    Text is decoded with orjson when it is installed, falling back to the
+    standard library where orjson would reject it or decode it differently,
+    so the result does not depend on optional dependencies.
+
+    Args:
+        schema: A schema dict or boolean, or its JSON encoding as str or bytes.
+
     Returns:
-        A dictionary mapping full definition paths to their schemas.
+        The decoded schema.
+
+    Raises:
+        ValueError: If the JSON text is malformed, or does not encode an
+            object or a boolean.
     """
-    defs: dict[str, dict[str, Any]] = {}
+    if isinstance(schema, (str, bytes)):
+        decoded = _decode_json(schema)
+        if not isinstance(decoded, (dict, bool)):
+            raise ValueError(
+                "JSON schema must be an object or a boolean, "
+                f"got {type(decoded).__name__}"
+            )
+        return decoded
+    return schema
+
 
-    # Get definitions at current level
-    current_defs = schema_dict.get("$defs", schema_dict.get("definitions", {}))
+def is_json_native(value: Any) -> bool:
+    """Return True if a value is built only from types JSON represents exactly.
 
-    for def_name, definition in current_defs.items():
-        # Build full path for nested definitions
-        full_name = f"{path}/{def_name}" if path else def_name
-        defs[full_name] = definition
+    That is ``str``, ``int``, finite ``float``, ``bool``, ``None``, ``list``
+    and ``dict`` with ``str`` keys, and no subclasses of these. Only such
+    values survive a JSON round trip unchanged; e.g. a tuple would come back
+    as a list and ``{1: "x"}`` as ``{"1": "x"}``, so their encodings cannot
+    tell them apart from other values.
+
+    Args:
+        value: The value to check.
+
+    Returns:
+        True if the JSON encoding of the value fully captures it.
+    """
+    # Explicit stack of (value, ids of enclosing containers), so that deeply
+    # nested or self-containing values are handled without recursion
+    stack: list[tuple[Any, tuple[int, ...]]] = [(value, ())]
+    while stack:
+        current, ancestors = stack.pop()
+        value_type = type(current)
+        if value_type is float:
+            if not math.isfinite(current):
+                return False
+        elif value_type is list or value_type is dict:
+            if id(current) in ancestors:
+                return False
+            nested = (*ancestors, id(current))
+            if value_type is dict:
+                if not all(type(name) is str for name in current):
+                    return False
+                current = current.values()
+            stack.extend((item, nested) for item in current)
+        elif current is not None and value_type not in _JSON_SCALAR_TYPES:
+            return False
+    return True
 
-        # Recursively collect nested definitions
-        if isinstance(definition, dict):
-            nested_defs = collect_definitions(definition, full_name)
-            defs.update(nested_defs)
 
-    return defs
+def schema_cache_key(schema: Any) -> str | bytes | None:
+    """Serialize a schema to a canonical form for use as a cache key.
 
+    Uses orjson when it is installed, which is an order of magnitude faster
+    than the standard library for this. Keys are only meant to be compared
+    with each other within one process, not decoded back into schemas.
 
+    Only schemas made of JSON-native values (see is_json_native) get a key.
+    Other values could share a key with a different schema: json writes
+    tuples as lists and int dict keys as strings, and orjson additionally
+    writes e.g. UUIDs, dates and enums as their plain JSON values. For
+    JSON-native schemas, both backends give equal keys for exactly the equal
+    schemas.
+
+    Args:
+        schema: The JSON Schema (or sub-schema) to serialize.
+
+    Returns:
+        Canonical JSON with sorted keys, as bytes (orjson) or str (json), or
+        None if the schema contains values that are not JSON-native.
+    """
+    if not is_json_native(schema):
+        return None
+    if _HAS_ORJSON:
+        try:
+            key: bytes = orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+            return key
+        except orjson.JSONEncodeError:
+            # Integers beyond 64 bits, which json handles
+            pass
+    return json.dumps(schema, sort_keys=True)
+
+
+def definition_key(path: str) -> str:
+    """Build the namespace key for a definition path.
+
+    Characters that are not valid in a Python identifier (including the
+    ``/`` separating nested definitions) are replaced with underscores. The
+    case of the name is preserved exactly, so ``UserInfo``, ``Userinfo`` and
+    ``userInfo`` map to distinct keys. Keys are interned, as they are
+    compared against the names returned by resolve_ref_path for every
+    reference.
+
+    A key is never a dunder name: for names ending in ``__`` an ``x`` is
+    appended (``doc__`` becomes ``__doc__x``), as forward references to e.g.
+    ``__doc__`` would resolve to module attributes rather than the namespace.
+
+    Args:
+        path: The definition path (e.g., "Address/Country").
+
+    Returns:
+        The namespace key (e.g., "__Address_Country").
+    """
+    key = "__" + _INVALID_IDENTIFIER_CHARS.sub("_", path)
+    if key.endswith("__"):
+        key += "x"
+    return sys.intern(key)
+
+
+@lru_cache(maxsize=4096)
 def resolve_ref_path(ref: str) -> str:
     """Resolve a $ref path to a namespace key.
 
+    Results are cached, as the same $ref is typically resolved many times
+    across a schema.
+
     Args:
         ref: The $ref string (e.g., "#/$defs/Address/$defs/Country").
 
     Returns:
-        The namespace key (e.g., "Address_Country").
+        The namespace key (e.g., "__Address_Country").
     """
-
-    def sanitize_name(name: str) -> str:
-        """Convert a name to a valid Python identifier."""
-        # Replace hyphens and other non-alphanumeric characters with underscores
-        return re.sub(r"[^a-zA-Z0-9_]", "_", name)
-
     if ref.startswith("#/"):
         # Remove leading #/ and split by /
-        ref_path = ref[2:]
-        # Extract the actual path (skip $defs/definitions keywords)
-        parts = ref_path.split("/")
+        parts = ref[2:].split("/")
         # Filter out $defs and definitions, keep the actual definition names
-        name_parts = [
-            sanitize_name(p) for p in parts if p not in ("$defs", "definitions")
-        ]
-        # Join with underscore and capitalize
-        return "__" + "_".join(name_parts).capitalize()
+        name_parts = [p for p in parts if p not in _REF_KEYWORDS]
+        return definition_key("/".join(name_parts))
     else:
         # External ref - just use the last part
-        return "__" + sanitize_name(ref.split("/")[-1]).capitalize()
+        return definition_key(ref.split("/")[-1])
+
+
+# Keywords an object sub-schema of allOf may carry and still be merged
+_MERGEABLE_OBJECT_KEYS: frozenset[str] = frozenset(
+    ("type", "properties", "required", "title", "description")
+)
+
+
+def can_merge_object_schemas(schemas: list[Any]) -> bool:
+    """Return True if plain object schemas can be validated as one model.
+
+    Used for ``allOf`` lists, so that a value can be validated against one
+    model combining the fields of every sub-schema, rather than against each
+    sub-schema in turn. Only schemas that are explicitly ``"type": "object"``
+    and carry nothing beyond properties and required fields qualify. A
+    property declared by more than one schema must be declared identically,
+    as the intersection of two differing property schemas cannot be
+    expressed as a single field.
+
+    Args:
+        schemas: The sub-schemas to check.
+
+    Returns:
+        True if the schemas are plain object schemas without conflicting
+        property declarations.
+    """
+    properties: dict[str, Any] = {}
+    for schema in schemas:
+        if (
+            not isinstance(schema, dict)
+            or schema.get("type") != "object"
+            or not _MERGEABLE_OBJECT_KEYS.issuperset(schema)
+        ):
+            return False
+        for prop_name, prop_schema in schema.get("properties", {}).items():
+            if properties.setdefault(prop_name, prop_schema) != prop_schema:
+                return False
+    return True
@@ -3,13 +3,27 @@
 import math
 import warnings
 from enum import Enum
-from typing import Annotated, Any, Dict, List, Optional, Tuple, Union
+from types import MappingProxyType
+from typing import (
+    Annotated,
+    Any,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from pydantic import VERSION as _PYDANTIC_VERSION
 from pydantic import ConfigDict, Field, create_model
+from pydantic_core import PydanticUndefined
 
 from ._property_renaming import rename_properties
-from ._schema_utils import resolve_ref_path
+from ._schema_utils import resolve_ref_path, schema_cache_key
 from ._validators import (
     create_const_validator,
     create_empty_enum_validator,
@@ -27,10 +41,105 @@ if _pydantic_version_tuple < (2, 11):
         stacklevel=2,
     )
 
+# JSON Schema "type" values and the Python types they map to. Read-only, as
+# it is shared by every converter.
+_TYPE_MAPPING: Mapping[str, Any] = MappingProxyType(
+    {
+        "string": str,
+        "number": float,
+        "integer": int,
+        "boolean": bool,
+        "array": List,
+        "object": Dict[str, Any],
+        "null": None,
+    }
+)
+
+# Keywords used to infer a type for schemas that have no explicit "type"
+_NUMERIC_CONSTRAINT_KEYS = frozenset(
+    ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum", "multipleOf")
+)
+_STRING_CONSTRAINT_KEYS = frozenset(("minLength", "maxLength", "pattern"))
+_ARRAY_CONSTRAINT_KEYS = frozenset(("minItems", "maxItems", "uniqueItems"))
+
+# Schemas of these types (or typeless enum/const schemas) convert to plain
+# types without creating models, so equal schemas can share one result.
+# Titled object schemas are shared as well, as their model name does not
+# depend on the conversion order.
+_SCALAR_TYPES = frozenset(("string", "number", "integer", "boolean", "null"))
+_COMPOSITION_KEYS = frozenset(("$ref", "allOf", "anyOf", "oneOf", "not"))
+
+
+def _content_schema_key(prop: dict[str, Any]) -> str | bytes | None:
+    """Return a content key for a shareable schema, or None if it is not.
+
+    Args:
+        prop: The JSON Schema property definition.
+
+    Returns:
+        A canonical JSON key for scalar, enum, const and titled object
+        schemas that contain no references or composition keywords at their
+        top level and only JSON-native values (see schema_cache_key);
+        otherwise None.
+    """
+    if not _COMPOSITION_KEYS.isdisjoint(prop):
+        return None
+
+    type_ = prop.get("type")
+    if type_ is None:
+        if "enum" not in prop and "const" not in prop:
+            return None
+    elif type_ == "object":
+        if not prop.get("title"):
+            return None
+    elif not isinstance(type_, str) or type_ not in _SCALAR_TYPES:
+        return None
+
+    return schema_cache_key(prop)
+
+
+# Model configs shared by all generated models. pydantic copies the config
+# into each model it creates, so these are never modified.
+_ALLOW_EXTRA_CONFIG = ConfigDict(serialize_by_alias=True, extra="allow")
+_FORBID_EXTRA_CONFIG = ConfigDict(serialize_by_alias=True, extra="forbid")
+
+
+# Member-less mixin bases for generated enums, defined once rather than
+# creating a new base class for every enum that is converted.
+class _StrEnum(str, Enum):
+    pass
+
+
+class _IntEnum(int, Enum):
+    pass
+
+
+class _FloatEnum(float, Enum):
+    pass
+
+
+def _is_nullable(type_: Any) -> bool:
+    """Return True if None is already a valid value for the given type.
+
+    Such types are not wrapped in Optional for non-required fields, which
+    would only add a redundant union for pydantic to build.
+    """
+    if type_ is Any or type_ is None:
+        return True
+    return get_origin(type_) is Union and type(None) in get_args(type_)
+
 
 class TypeConverter:
     """Converts JSON Schema types to Pydantic types."""
 
+    __slots__ = (
+        "namespace",
+        "dynamic_type_counter",
+        "_convert_cache",
+        "_content_cache",
+        "_enum_cache",
+    )
+
     def __init__(self, namespace: dict[str, Any]):
         """Initialize the type converter.
 
@@ -39,19 +148,57 @@ class TypeConverter:
         """
         self.namespace = namespace
         self.dynamic_type_counter = 0
+        # Keyed by id(); the schema dict is kept alongside the result so the
+        # id cannot be reused by another object while the converter lives.
+        self._convert_cache: dict[int, tuple[dict[str, Any], Any]] = {}
+        # Keyed by canonical JSON of shareable schemas (see _content_schema_key)
+        self._content_cache: dict[str | bytes, Any] = {}
+        # Keyed by (mixin base, class name, member values), so enums that only
+        # differ in keywords such as "description" share one class
+        self._enum_cache: dict[tuple[Any, str, tuple[Any, ...]], Any] = {}
 
     def convert(self, prop: dict[str, Any]) -> Any:
         """Convert a JSON Schema property to a Pydantic type.
 
+        Conversions are memoized on the identity of ``prop``, so a sub-schema
+        object shared between several places in the schema is converted once.
+        Scalar, enum, const and titled object schemas are additionally
+        memoized on their content, so equal schemas share a single converted
+        type or model. A result is only shared if its conversion did not
+        allocate a ``DynamicType_N`` name, so that generated names stay the
+        same as without sharing.
+
         Args:
             prop: The JSON Schema property definition.
 
         Returns:
             A Pydantic type or model.
         """
+        cached = self._convert_cache.get(id(prop))
+        if cached is not None:
+            return cached[1]
+
+        key = _content_schema_key(prop)
+        if key is not None and key in self._content_cache:
+            result = self._content_cache[key]
+        else:
+            dynamic_type_counter = self.dynamic_type_counter
+            result = self._convert_schema(prop)
+            if key is not None and self.dynamic_type_counter == dynamic_type_counter:
+                self._content_cache[key] = result
+
+        self._convert_cache[id(prop)] = (prop, result)
+        return result
+
+    def _convert_schema(self, prop: dict[str, Any]) -> Any:
+        """Convert a JSON Schema property without consulting the cache."""
         # Handle $ref
         if "$ref" in prop:
-            return resolve_ref_path(prop["$ref"])
+            key = resolve_ref_path(prop["$ref"])
+            # Definitions that are already built are used directly. Refs to
+            # later or recursive definitions stay as forward-ref strings and
+            # are resolved when rebuilding against the namespace.
+            return self.namespace.get(key, key)
 
         # Handle allOf
         if "allOf" in prop:
@@ -113,8 +260,6 @@ class TypeConverter:
         Returns:
             Either a Literal type or an Enum class.
         """
-        from typing import Literal
-
         # Check if we need to use Literal instead of Enum
         use_literal = False
 
@@ -135,23 +280,23 @@ class TypeConverter:
         # Use Enum for homogeneous non-boolean types
         first_val = enum_values[0]
         if isinstance(first_val, str):
-            enum_base_type: Any = str
+            enum_base: Any = _StrEnum
         elif isinstance(first_val, int):
-            enum_base_type = int
+            enum_base = _IntEnum
         elif isinstance(first_val, float):
-            enum_base_type = float
+            enum_base = _FloatEnum
         else:
             return Literal[tuple(enum_values)]
 
-        dynamic_members = {f"KEY_{i}": value for i, value in enumerate(enum_values)}
-
         # Use the title if provided, otherwise use a dynamic name
         enum_name = title if title else "DynamicEnum"
 
-        class DynamicEnum(enum_base_type, Enum):
-            pass
-
-        return DynamicEnum(enum_name, dynamic_members)  # type: ignore[call-arg]
+        key = (enum_base, enum_name, tuple(enum_values))
+        enum_class = self._enum_cache.get(key)
+        if enum_class is None:
+            dynamic_members = {f"KEY_{i}": value for i, value in enumerate(enum_values)}
+            enum_class = self._enum_cache[key] = enum_base(enum_name, dynamic_members)
+        return enum_class
 
     def _convert_typed(self, prop: dict[str, Any]) -> Any:
         """Convert a schema with explicit type field.
@@ -162,16 +307,6 @@ class TypeConverter:
         Returns:
             The converted Pydantic type.
         """
-        type_mapping = {
-            "string": str,
-            "number": float,
-            "integer": int,
-            "boolean": bool,
-            "array": List,
-            "object": Dict[str, Any],
-            "null": None,
-        }
-
         type_ = prop["type"]
 
         # Handle enum with type
@@ -188,7 +323,7 @@ class TypeConverter:
 
         # Handle numbers with constraints
         if type_ in ("integer", "number"):
-            base_type = type_mapping[type_]
+            base_type = _TYPE_MAPPING[type_]
             assert isinstance(base_type, type)  # int or float
             return self._convert_number(prop, base_type)
 
@@ -196,10 +331,10 @@ class TypeConverter:
         if type_ == "object":
             return self._convert_object(prop)
 
-        if type_ not in type_mapping:
+        if type_ not in _TYPE_MAPPING:
             raise ValueError(f"Unknown JSON Schema type: {type_!r}")
 
-        return type_mapping[type_]
+        return _TYPE_MAPPING[type_]
 
     def _convert_array(self, prop: dict[str, Any]) -> Any:
         """Convert an array schema."""
@@ -282,44 +417,39 @@ class TypeConverter:
         # Rename reserved / underscore-prefixed property names inline
         raw_required = prop.get("required", [])
         properties = prop.get("properties", {})
-        field_map, required_fields = rename_properties(properties, raw_required)
+        field_map, renamed_required = rename_properties(properties, raw_required)
+        # Checked once per property, so use a set rather than the list
+        required_fields = frozenset(renamed_required)
 
         # Build fields
         fields: dict[str, Any] = {}
         for original_name, property in properties.items():
             safe_name, alias = field_map[original_name]
-            pydantic_type = (
-                self.convert(property) if isinstance(property, dict) else Any
-            )
-            field_kwargs: dict[str, Any] = {}
-
-            if isinstance(property, dict) and "default" in property:
-                field_kwargs["default"] = property["default"]
-            elif safe_name not in required_fields:
-                pydantic_type = Optional[pydantic_type]
-                field_kwargs["default"] = None
-
+            # PydanticUndefined is what Field() itself uses for omitted arguments
             if isinstance(property, dict):
-                if "description" in property:
-                    field_kwargs["description"] = property["description"]
-                if "title" in property:
-                    field_kwargs["title"] = property["title"]
-
-            field_kwargs["alias"] = alias
+                pydantic_type = self.convert(property)
+                default = property.get("default", PydanticUndefined)
+                description = property.get("description", PydanticUndefined)
+                field_title = property.get("title", PydanticUndefined)
+            else:
+                pydantic_type = Any
+                default = description = field_title = PydanticUndefined
 
-            fields[safe_name] = (pydantic_type, Field(**field_kwargs))
+            if default is PydanticUndefined and safe_name not in required_fields:
+                if not _is_nullable(pydantic_type):
+                    pydantic_type = Optional[pydantic_type]
+                default = None
 
-        # Build ConfigDict
-        config = ConfigDict(serialize_by_alias=True)
+            fields[safe_name] = (
+                pydantic_type,
+                Field(default, alias=alias, title=field_title, description=description),
+            )
 
-        if "additionalProperties" in prop:
-            if prop["additionalProperties"] is False:
-                config["extra"] = "forbid"
-            else:
-                config["extra"] = "allow"
+        # Additional properties are allowed unless explicitly disabled
+        if prop.get("additionalProperties", True) is False:
+            config = _FORBID_EXTRA_CONFIG
         else:
-            # Default is to allow additional properties
-            config["extra"] = "allow"
+            config = _ALLOW_EXTRA_CONFIG
 
         additional_properties_type: Any = Any
         if "additionalProperties" in prop and isinstance(
@@ -345,24 +475,15 @@ class TypeConverter:
     def _infer_from_constraints(self, prop: dict[str, Any]) -> Any:
         """Try to infer type from constraint keywords."""
         # Numeric constraints
-        if any(
-            k in prop
-            for k in [
-                "minimum",
-                "maximum",
-                "exclusiveMinimum",
-                "exclusiveMaximum",
-                "multipleOf",
-            ]
-        ):
+        if not _NUMERIC_CONSTRAINT_KEYS.isdisjoint(prop):
             return self._convert_number(prop, float)
 
         # String constraints
-        if any(k in prop for k in ["minLength", "maxLength", "pattern"]):
+        if not _STRING_CONSTRAINT_KEYS.isdisjoint(prop):
             return self._convert_string(prop)
 
         # Array constraints
-        if any(k in prop for k in ["minItems", "maxItems", "uniqueItems"]):
+        if not _ARRAY_CONSTRAINT_KEYS.isdisjoint(prop):
             return self._convert_array(prop)
 
         return Any
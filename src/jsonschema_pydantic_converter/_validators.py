@@ -2,7 +2,113 @@
 
 from typing import Annotated, Any
 
-from pydantic import BeforeValidator, Field, TypeAdapter
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    create_model,
+)
+from pydantic.fields import FieldInfo
+
+from ._schema_utils import can_merge_object_schemas
+
+
+def build_type_adapter(type_: Any, namespace: dict[str, Any]) -> TypeAdapter[Any]:
+    """Build a TypeAdapter for a converted type, resolving refs against namespace.
+
+    The adapter is only rebuilt when pydantic could not complete it on
+    construction, i.e. when the type still contains unresolved forward refs.
+
+    Args:
+        type_: The converted type to wrap.
+        namespace: Type namespace for forward references.
+
+    Returns:
+        A TypeAdapter ready for validation.
+    """
+    adapter: TypeAdapter[Any] = TypeAdapter(type_)
+    if not adapter.pydantic_complete:
+        adapter.rebuild(force=True, _types_namespace=namespace)
+    return adapter
+
+
+def _merge_object_models(
+    models: list[type[BaseModel]], namespace: dict[str, Any]
+) -> type[BaseModel] | None:
+    """Combine the fields of several object models into one model.
+
+    Each field keeps the definition of the model it came from, and is
+    required if any of the models requires it, so validating against the
+    combined model accepts exactly the values all of the models accept.
+
+    Args:
+        models: The models converted from plain object sub-schemas.
+        namespace: Type namespace for forward references.
+
+    Returns:
+        The combined model, or None if two models define a field of the same
+        name for different properties (e.g. after renaming reserved names).
+    """
+    fields: dict[str, FieldInfo] = {}
+    for model in models:
+        if not model.__pydantic_complete__:
+            model.model_rebuild(force=True, _types_namespace=namespace)
+        for name, field in model.model_fields.items():
+            existing = fields.get(name)
+            if existing is not None:
+                if existing.alias != field.alias:
+                    return None
+                if existing.is_required() or not field.is_required():
+                    continue
+            fields[name] = field
+
+    field_definitions: dict[str, Any] = {
+        name: (field.annotation, field) for name, field in fields.items()
+    }
+    return create_model(
+        "AllOf", __config__=ConfigDict(extra="allow"), **field_definitions
+    )
+
+
+def _build_intersection_adapters(
+    converted_types: list[Any], merge: bool, namespace: dict[str, Any]
+) -> list[TypeAdapter[Any]]:
+    """Build the adapters an allOf value is validated against.
+
+    Args:
+        converted_types: The converted sub-schema types.
+        merge: Whether the types are models of mergeable object schemas.
+        namespace: Type namespace for forward references.
+
+    Returns:
+        A single adapter for the combined model if the types could be
+        merged, otherwise one adapter per type.
+    """
+    if merge:
+        combined = _merge_object_models(converted_types, namespace)
+        if combined is not None:
+            return [build_type_adapter(combined, namespace)]
+    return [build_type_adapter(type_, namespace) for type_ in converted_types]
+
+
+def _replace_json_schema(override: dict[str, Any]) -> Any:
+    """Build a json_schema_extra callable that replaces the generated schema.
+
+    Args:
+        override: The schema to report instead, built once up front.
+
+    Returns:
+        A callable for use as ``Field(json_schema_extra=...)``.
+    """
+
+    def json_schema_extra(schema_dict: dict[str, Any]) -> None:
+        """Replace the generated schema with the original structure."""
+        schema_dict.clear()
+        schema_dict.update(override)
+
+    return json_schema_extra
 
 
 def create_intersection_validator(
@@ -20,19 +126,32 @@ def create_intersection_validator(
     Returns:
         An Annotated type with validation logic.
     """
-    converted_types = [convert_type_fn(sub) for sub in sub_schemas]
+    # The same schema object listed more than once (e.g. a shared sub-schema)
+    # only needs to be validated against once.
+    unique_schemas = list({id(sub): sub for sub in sub_schemas}.values())
+    converted_types = [convert_type_fn(sub) for sub in unique_schemas]
+    # Plain object sub-schemas are validated against one model combining
+    # their fields, so the value is validated in one pass instead of once per
+    # sub-schema. Each sub-schema is still converted on its own above, so the
+    # generated models and their names are the same either way.
+    merge = len(unique_schemas) > 1 and can_merge_object_schemas(unique_schemas)
+
+    # Adapters are built on first use rather than here, since the namespace is
+    # only fully populated once the whole schema has been converted.
+    adapters: list[TypeAdapter[Any]] | None = None
 
     def validate_all(value: Any) -> Any:
         """Validate that the value satisfies all sub-schemas."""
-        for converted_type in converted_types:
-            try:
-                adapter = TypeAdapter(converted_type)
-                adapter.rebuild(force=True, _types_namespace=namespace)
+        nonlocal adapters
+        try:
+            if adapters is None:
+                adapters = _build_intersection_adapters(
+                    converted_types, merge, namespace
+                )
+            for adapter in adapters:
                 adapter.validate_python(value)
-            except Exception as e:
-                raise ValueError(
-                    f"Value does not satisfy all schemas in allOf: {e}"
-                ) from e
+        except Exception as e:
+            raise ValueError(f"Value does not satisfy all schemas in allOf: {e}") from e
         return value
 
     # Check if any sub-schema contains $ref
@@ -42,16 +161,10 @@ def create_intersection_validator(
         # Don't override json_schema when $refs are present
         return Annotated[Any, BeforeValidator(validate_all)]
     else:
-
-        def json_schema_extra(schema_dict: dict[str, Any]) -> None:
-            """Override the generated schema with the original allOf structure."""
-            schema_dict.clear()
-            schema_dict["allOf"] = sub_schemas
-
         return Annotated[
             Any,
             BeforeValidator(validate_all),
-            Field(json_schema_extra=json_schema_extra),
+            Field(json_schema_extra=_replace_json_schema({"allOf": sub_schemas})),
         ]
 
 
@@ -69,33 +182,31 @@ def create_not_validator(
         An Annotated type with negation validation logic.
     """
     not_type = convert_type_fn(not_schema)
+    adapter: TypeAdapter[Any] | None = None
 
     def validate_not(value: Any) -> Any:
         """Validate that the value does NOT satisfy the not schema."""
+        nonlocal adapter
         try:
-            adapter = TypeAdapter(not_type)
-            adapter.rebuild(force=True, _types_namespace=namespace)
-            adapter.validate_python(value)
-            # If validation succeeds, the value is invalid for 'not'
+            if adapter is None:
+                adapter = build_type_adapter(not_type, namespace)
+            # isinstance_python reports a mismatch as False instead of raising,
+            # which is the common path for 'not'
+            matches = adapter.validator.isinstance_python(value)
+        except Exception:
+            # Any failure to validate means the value is valid for 'not'
+            return value
+
+        if matches:
             raise ValueError(
                 f"Value {value!r} should not match the 'not' schema but it does"
             )
-        except Exception as e:
-            # If it's our ValueError, re-raise it
-            if "should not match the 'not' schema" in str(e):
-                raise
-            # Any other exception means validation failed, so value is valid for 'not'
-            return value
-
-    def json_schema_extra(schema_dict: dict[str, Any]) -> None:
-        """Override the generated schema with the original not structure."""
-        schema_dict.clear()
-        schema_dict["not"] = not_schema
+        return value
 
     return Annotated[
         Any,
         BeforeValidator(validate_not),
-        Field(json_schema_extra=json_schema_extra),
+        Field(json_schema_extra=_replace_json_schema({"not": not_schema})),
     ]
 
 
@@ -115,15 +226,10 @@ def create_const_validator(const_value: Any) -> Any:
             raise ValueError(f"Value must be exactly {const_value!r}, got {value!r}")
         return value
 
-    def json_schema_extra(schema_dict: dict[str, Any]) -> None:
-        """Override the generated schema with the original const structure."""
-        schema_dict.clear()
-        schema_dict["const"] = const_value
-
     return Annotated[
         Any,
         BeforeValidator(validate_const),
-        Field(json_schema_extra=json_schema_extra),
+        Field(json_schema_extra=_replace_json_schema({"const": const_value})),
     ]
 
 
@@ -4,17 +4,24 @@ This module provides functionality to transform JSON Schema dictionaries into Py
 models at runtime, wrapped in TypeAdapters for validation and serialization.
 """
 
-import re
+import json
+from functools import lru_cache
 from typing import Annotated, Any
 
 from pydantic import BaseModel, BeforeValidator, TypeAdapter
 
-from ._schema_utils import collect_definitions
+from ._schema_utils import (
+    definition_key,
+    iter_definitions,
+    load_schema,
+    schema_cache_key,
+)
 from ._type_converters import TypeConverter
+from ._validators import build_type_adapter
 
 
 def create_type_adapter(
-    schema: dict[str, Any] | bool,
+    schema: dict[str, Any] | bool | str | bytes,
     _namespace: dict[str, Any] | None = None,
 ) -> TypeAdapter[Any]:
     """Convert a JSON Schema dict to a Pydantic TypeAdapter.
@@ -27,7 +34,8 @@ def create_type_adapter(
         schema: JSON schema dictionary following the JSON Schema specification.
                 Supports primitive types, objects, arrays, enums, references ($ref),
                 and schema composition (allOf, anyOf, oneOf, not).
-                Can also be a boolean (true accepts all, false rejects all).
+                Can also be a boolean (true accepts all, false rejects all),
+                or the schema's JSON encoding as str or bytes.
         _namespace: Optional namespace dict to populate with type definitions.
                    If provided, this namespace will be populated with all generated
                    types and used for type resolution. This is primarily for internal
@@ -51,6 +59,8 @@ def create_type_adapter(
         >>> adapter = create_type_adapter(schema)
         >>> obj = adapter.validate_python({"name": "Alice", "age": 30})
     """
+    schema = load_schema(schema)
+
     # Handle boolean schemas
     if isinstance(schema, bool):
         if schema is True:
@@ -67,30 +77,71 @@ def create_type_adapter(
     # Use provided namespace or create a new one
     namespace: dict[str, Any] = _namespace if _namespace is not None else {}
 
-    # Collect all definitions (top-level and nested)
-    all_definitions = collect_definitions(schema)
-
     # Create type converter
     converter = TypeConverter(namespace)
 
-    # Populate namespace with all definitions
-    for name, definition in all_definitions.items():
+    # Populate namespace with all definitions (top-level and nested), converting
+    # each one as the walk reaches it
+    for name, definition in iter_definitions(schema):
         model = converter.convert(definition)
-        # Sanitize the name to create a valid Python identifier
-        sanitized_name = re.sub(r"[^a-zA-Z0-9_]", "_", name.replace("/", "_"))
-        # Use the sanitized name as the key, capitalized for consistency
-        namespace["__" + sanitized_name.capitalize()] = model
+        # Key must match what resolve_ref_path produces for refs to this def
+        namespace[definition_key(name)] = model
 
-    # Rebuild all models in the namespace so cross-def forward refs are resolved.
+    # Rebuild the models in the namespace so cross-def forward refs are resolved.
     # Without this, a def that references another def remains incomplete
     # (__pydantic_complete__ == False), which breaks consumers that copy field
-    # annotations into a new create_model in a different module.
+    # annotations into a new create_model in a different module. Models that
+    # pydantic already completed have no refs left to resolve.
     for value in namespace.values():
-        if isinstance(value, type) and issubclass(value, BaseModel):
+        if (
+            isinstance(value, type)
+            and issubclass(value, BaseModel)
+            and not value.__pydantic_complete__
+        ):
             value.model_rebuild(force=True, _types_namespace=namespace)
 
     # Convert the main schema
     model = converter.convert(schema)
-    type_adapter = TypeAdapter(model)
-    type_adapter.rebuild(force=True, _types_namespace=namespace)
-    return type_adapter
+    return build_type_adapter(model, namespace)
+
+
+def get_type_adapter(
+    schema: dict[str, Any] | bool | str | bytes,
+) -> TypeAdapter[Any]:
+    """Return a cached Pydantic TypeAdapter for a JSON Schema.
+
+    Behaves like `create_type_adapter()`, but schemas with equal content share
+    a single TypeAdapter, so the schema is only converted the first time it is
+    seen. Use this when the same schema is used repeatedly, e.g. once per
+    request. The cache holds up to 512 schemas.
+
+    The adapter is built from a copy of the schema, so later changes to the
+    passed dict do not affect it. Schemas containing values that JSON cannot
+    represent exactly (such as tuples, non-string dict keys or NaN) are not
+    cached, and are converted by `create_type_adapter()` on every call.
+
+    Args:
+        schema: JSON schema dictionary following the JSON Schema specification,
+                a boolean schema, or the schema's JSON encoding as str or bytes.
+
+    Returns:
+        A Pydantic TypeAdapter wrapping the dynamically generated model.
+
+    Example:
+        >>> schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+        >>> adapter = get_type_adapter(schema)
+        >>> adapter is get_type_adapter(dict(schema))
+        True
+    """
+    schema = load_schema(schema)
+    # Only schemas that survive the JSON round trip unchanged get a key
+    key = schema_cache_key(schema)
+    if key is None:
+        return create_type_adapter(schema)
+    return _create_type_adapter_cached(key)
+
+
+@lru_cache(maxsize=512)
+def _create_type_adapter_cached(schema_json: str | bytes) -> TypeAdapter[Any]:
+    """Build a TypeAdapter from a canonical JSON encoding of a schema."""
+    return create_type_adapter(json.loads(schema_json))
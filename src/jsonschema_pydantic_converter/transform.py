@@ -8,12 +8,13 @@ from .create_type_adapter import create_type_adapter
 
 
 def transform(
-    schema: dict[str, Any],
+    schema: dict[str, Any] | str | bytes,
 ) -> Type[BaseModel]:
     """Convert a JSON schema dict to a Pydantic model.
 
     Args:
-        schema: JSON schema dictionary following the JSON Schema specification.
+        schema: JSON schema dictionary following the JSON Schema specification,
+                or its JSON encoding as str or bytes.
                 Non-object types are converted into `RootModel`.
 
     Returns:
@@ -38,7 +39,7 @@ def transform(
 
 
 def transform_with_modules(
-    schema: dict[str, Any],
+    schema: dict[str, Any] | str | bytes,
 ) -> Tuple[type[BaseModel], dict[str, Any]]:
     """Convert a JSON schema dict to a Pydantic model with its namespace.
 
@@ -47,7 +48,8 @@ def transform_with_modules(
     programmatic inspection or custom type resolution.
 
     Args:
-        schema: JSON schema dictionary following the JSON Schema specification.
+        schema: JSON schema dictionary following the JSON Schema specification,
+                or its JSON encoding as str or bytes.
                 Non-object types are converted into `RootModel`.
 
     Returns:
@@ -4,6 +4,8 @@ from typing import Any
 
 import pytest
 
+from jsonschema_pydantic_converter import _schema_utils
+
 
 def normalize_schema_additional_properties(schema: Any) -> Any:
     """Recursively add additionalProperties: True to objects that don't have it.
@@ -60,3 +62,11 @@ def normalize_schema_additional_properties(schema: Any) -> Any:
 def normalize_schema():
     """Fixture to normalize schemas for comparison."""
     return normalize_schema_additional_properties
+
+
+@pytest.fixture(params=[False, True], ids=["json", "orjson"])
+def json_backend(request, monkeypatch):
+    """Run a test with the stdlib json backend and, if installed, orjson."""
+    if request.param:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(_schema_utils, "_HAS_ORJSON", request.param)
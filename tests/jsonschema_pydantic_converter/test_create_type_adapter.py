@@ -1,10 +1,15 @@
+import json
 from enum import Enum
 from typing import List, Optional
 
 import pytest
 from pydantic import BaseModel, Field, ValidationError
 
-from jsonschema_pydantic_converter import create_type_adapter
+from jsonschema_pydantic_converter import (
+    _schema_utils,
+    create_type_adapter,
+    get_type_adapter,
+)
 
 
 def test_dynamic_schema(normalize_schema):
@@ -703,3 +708,386 @@ def test_cross_def_models_are_complete():
         assert model.__pydantic_complete__, (  # type: ignore[attr-defined]
             f"Model {key} has unresolved forward refs"
         )
+
+
+def test_shared_subschema_converted_once():
+    """A sub-schema object reused in several places yields a single model."""
+    address = {
+        "type": "object",
+        "properties": {"city": {"type": "string"}},
+    }
+    schema = {
+        "type": "object",
+        "properties": {"home": address, "work": address},
+    }
+
+    adapter = create_type_adapter(schema)
+    result = adapter.validate_python(
+        {"home": {"city": "Paris"}, "work": {"city": "Berlin"}}
+    )
+
+    assert type(result.home) is type(result.work)
+    assert result.home.city == "Paris"
+    assert result.work.city == "Berlin"
+
+
+def test_definition_name_ending_in_dunder_suffix():
+    """Definition keys are never dunder names shadowed by module attributes."""
+    schema = {
+        "$ref": "#/$defs/A",
+        "$defs": {
+            "A": {
+                "type": "object",
+                "properties": {"p": {"$ref": "#/$defs/doc__"}},
+                "required": ["p"],
+            },
+            "doc__": {
+                "type": "object",
+                "properties": {"q": {"type": "integer"}},
+                "required": ["q"],
+            },
+        },
+    }
+
+    namespace: dict[str, type] = {}
+    adapter = create_type_adapter(schema, _namespace=namespace)
+
+    assert "__doc__x" in namespace
+    assert adapter.validate_python({"p": {"q": 1}}).p.q == 1
+    with pytest.raises(ValidationError):
+        adapter.validate_python({"p": {"q": "x"}})
+
+
+def test_definition_names_differing_only_in_case():
+    """Definition keys keep their casing, so similar names do not collide."""
+    schema = {
+        "type": "object",
+        "properties": {
+            "first": {"$ref": "#/$defs/UserInfo"},
+            "second": {"$ref": "#/$defs/Userinfo"},
+            "third": {"$ref": "#/$defs/userInfo"},
+        },
+        "$defs": {
+            "UserInfo": {
+                "type": "object",
+                "properties": {"name": {"type": "string"}},
+                "required": ["name"],
+            },
+            "Userinfo": {
+                "type": "object",
+                "properties": {"id": {"type": "integer"}},
+                "required": ["id"],
+            },
+            "userInfo": {
+                "type": "object",
+                "properties": {"email": {"type": "string"}},
+                "required": ["email"],
+            },
+        },
+    }
+
+    namespace: dict[str, type] = {}
+    adapter = create_type_adapter(schema, _namespace=namespace)
+
+    assert "__UserInfo" in namespace
+    assert "__Userinfo" in namespace
+    assert "__userInfo" in namespace
+    result = adapter.validate_python(
+        {"first": {"name": "Ada"}, "second": {"id": 1}, "third": {"email": "a@b.c"}}
+    )
+    assert result.first.name == "Ada"
+    assert result.second.id == 1
+    assert result.third.email == "a@b.c"
+
+
+def test_allof_in_definition_referencing_later_definition():
+    """allOf inside a def may reference defs that are converted after it."""
+    schema = {
+        "type": "object",
+        "properties": {"item": {"$ref": "#/$defs/Item"}},
+        "$defs": {
+            "Item": {"allOf": [{"$ref": "#/$defs/Base"}, {"required": ["id"]}]},
+            "Base": {
+                "type": "object",
+                "properties": {"id": {"type": "integer"}},
+            },
+        },
+    }
+
+    adapter = create_type_adapter(schema)
+
+    for _ in range(2):
+        result = adapter.validate_python({"item": {"id": 1}})
+        assert result.item == {"id": 1}
+        with pytest.raises(ValidationError):
+            adapter.validate_python({"item": {"id": "not-an-int"}})
+
+
+def test_equal_enum_schemas_share_one_enum():
+    """Structurally equal enum schemas convert to a single Enum class."""
+    schema = {
+        "type": "object",
+        "properties": {
+            "primary": {"type": "string", "enum": ["red", "green"], "title": "Color"},
+            "secondary": {"type": "string", "enum": ["red", "green"], "title": "Color"},
+        },
+        "required": ["primary", "secondary"],
+    }
+
+    adapter = create_type_adapter(schema)
+    result = adapter.validate_python({"primary": "red", "secondary": "green"})
+
+    assert type(result.primary) is type(result.secondary)
+    assert issubclass(type(result.primary), Enum)
+
+
+def test_enums_differing_only_in_description_share_one_enum():
+    """Enums with the same name and values share a class regardless of docs."""
+    schema = {
+        "type": "object",
+        "properties": {
+            "status": {"type": "string", "enum": ["on", "off"], "description": "A"},
+            "state": {"type": "string", "enum": ["on", "off"], "description": "B"},
+            "other": {"type": "string", "enum": ["off", "on"]},
+        },
+        "required": ["status", "state", "other"],
+    }
+
+    adapter = create_type_adapter(schema)
+    result = adapter.validate_python({"status": "on", "state": "off", "other": "on"})
+
+    assert type(result.status) is type(result.state)
+    # Member order is significant, so a reordered enum is a separate class
+    assert type(result.other) is not type(result.status)
+
+
+def test_get_type_adapter_reuses_adapter_for_equal_schemas():
+    """get_type_adapter returns one cached adapter per distinct schema."""
+    schema = {
+        "type": "object",
+        "properties": {"name": {"type": "string"}},
+        "required": ["name"],
+    }
+
+    adapter = get_type_adapter(schema)
+
+    # Equal content, different dict object and key order
+    assert get_type_adapter({"required": ["name"], **schema}) is adapter
+    assert get_type_adapter({"type": "integer"}) is not adapter
+    assert adapter.validate_python({"name": "Alice"}).name == "Alice"
+
+    # Mutating the original schema does not affect the cached adapter
+    schema["properties"]["name"]["type"] = "integer"
+    assert adapter.validate_python({"name": "Bob"}).name == "Bob"
+
+
+@pytest.mark.parametrize(
+    ("const", "other"),
+    [({1: "x"}, {"1": "x"}), ((1, 2), [1, 2])],
+    ids=["int-keys", "tuple"],
+)
+def test_get_type_adapter_matches_create_type_adapter(const, other):
+    """Schemas that JSON cannot represent exactly are converted unchanged."""
+    adapter = get_type_adapter({"const": const})
+
+    assert adapter.validate_python(const) == const
+    with pytest.raises(ValidationError):
+        adapter.validate_python(other)
+    """Test that allOf of plain object schemas validates as one merged model."""
+    shared = {"type": "string"}
+    schema = {
+        "allOf": [
+            {
+                "type": "object",
+                "properties": {"id": shared, "name": {"type": "string"}},
+                "required": ["id"],
+            },
+            {
+                "type": "object",
+                "properties": {"id": shared, "age": {"type": "integer"}},
+                "required": ["id", "age"],
+            },
+        ]
+    }
+    adapter = create_type_adapter(schema)
+
+    value = {"id": "1", "name": "Alice", "age": 30, "extra": True}
+    assert adapter.validate_python(value) == value
+
+    with pytest.raises((ValidationError, ValueError)):
+        adapter.validate_python({"id": "1", "name": "Alice"})  # Missing 'age'
+    with pytest.raises((ValidationError, ValueError)):
+        adapter.validate_python({"id": "1", "age": "old"})
+    with pytest.raises((ValidationError, ValueError)):
+        adapter.validate_python("not an object")
+
+    assert adapter.json_schema() == schema
+
+
+def test_equal_titled_object_schemas_share_one_model():
+    """Equal titled object schemas convert to one model; untitled ones do not."""
+    address = {
+        "type": "object",
+        "title": "Address",
+        "properties": {"city": {"type": "string"}},
+    }
+    untitled = {"type": "object", "properties": {"id": {"type": "integer"}}}
+    schema = {
+        "type": "object",
+        "properties": {
+            "home": address,
+            "work": dict(address),
+            "first": untitled,
+            "second": dict(untitled),
+        },
+    }
+
+    adapter = create_type_adapter(schema)
+    result = adapter.validate_python(
+        {"home": {"city": "A"}, "work": {"city": "B"}, "first": {}, "second": {}}
+    )
+
+    assert type(result.home) is type(result.work)
+    assert type(result.first).__name__ == "DynamicType_1"
+    assert type(result.second).__name__ == "DynamicType_2"
+
+
+@pytest.mark.parametrize(
+    "schema_json",
+    [
+        '{"type": "object", "properties": {"n": {"type": "integer"}}}',
+        b'{"type": "object", "properties": {"n": {"type": "integer"}}}',
+    ],
+)
+def test_schema_as_json_text(schema_json):
+    """Schemas may be passed as their JSON encoding."""
+    adapter = create_type_adapter(schema_json)
+
+    assert adapter.validate_python({"n": 1}).n == 1
+    with pytest.raises(ValidationError):
+        adapter.validate_python({"n": "x"})
+
+    assert get_type_adapter(schema_json) is get_type_adapter(schema_json)
+
+
+@pytest.mark.parametrize("schema_json", ["[1]", "1", "null", b'"string"'])
+def test_schema_as_json_text_must_be_object_or_bool(schema_json):
+    """JSON text that does not encode an object or boolean is rejected."""
+    with pytest.raises(ValueError, match="must be an object or a boolean"):
+        create_type_adapter(schema_json)
+
+
+@pytest.mark.parametrize(
+    "schema_json",
+    [
+        '{"type": "number", "not": {"const": NaN}}',
+        b'{"type": "number", "maximum": 1e400}',
+        '{"type": "integer", "maximum": 18446744073709551616}',
+        b'{"type": "integer", "minimum": -9223372036854775809}',
+        '{"type": "string", "title": "caf\u00e9"}',
+    ],
+)
+def test_schema_as_json_text_decoded_like_stdlib_json(json_backend, schema_json):
+    """JSON text decodes to the same schema whether or not orjson is used."""
+    decoded = _schema_utils.load_schema(schema_json)
+
+    assert repr(decoded) == repr(json.loads(schema_json))
+
+
+def test_schema_as_json_text_with_big_integers(json_backend):
+    """Integers beyond 64 bits in JSON text are not rounded to floats."""
+    adapter = create_type_adapter(
+        '{"type": "integer", "maximum": 18446744073709551616}'
+    )
+
+    assert adapter.validate_python(2**64) == 2**64
+    with pytest.raises(ValidationError):
+        adapter.validate_python(2**64 + 1)
+    assert create_type_adapter("true").validate_python(1) == 1
+
+
+def test_allof_object_required_declared_in_other_branch():
+    """A branch only enforces required names among its own properties."""
+    schema = {
+        "allOf": [
+            {"type": "object", "properties": {"x": {"type": "integer"}}},
+            {"type": "object", "required": ["x"]},
+        ]
+    }
+    adapter = create_type_adapter(schema)
+
+    assert adapter.validate_python({}) == {}
+    with pytest.raises((ValidationError, ValueError)):
+        adapter.validate_python({"x": "not an int"})
+
+
+def test_allof_object_schemas_keep_generated_model_names():
+    """Merged allOf branches allocate the same DynamicType names as before."""
+    schema = {
+        "type": "object",
+        "properties": {
+            "combo": {
+                "allOf": [
+                    {"type": "object", "properties": {"a": {"type": "string"}}},
+                    {"type": "object", "properties": {"b": {"type": "string"}}},
+                ]
+            },
+            "other": {"type": "object", "properties": {"c": {"type": "string"}}},
+        },
+    }
+    adapter = create_type_adapter(schema)
+
+    result = adapter.validate_python({"combo": {"a": "x", "b": "y"}, "other": {}})
+    assert result.combo == {"a": "x", "b": "y"}
+    assert type(result.other).__name__ == "DynamicType_3"
+
+
+def test_allof_object_schemas_with_forward_refs():
+    """Merged allOf branches resolve refs to definitions converted later."""
+    schema = {
+        "type": "object",
+        "properties": {
+            "item": {
+                "allOf": [
+                    {
+                        "type": "object",
+                        "properties": {"tag": {"$ref": "#/$defs/Tag"}},
+                        "required": ["tag"],
+                    },
+                    {"type": "object", "properties": {"n": {"type": "integer"}}},
+                ]
+            }
+        },
+        "$defs": {
+            "Tag": {
+                "type": "object",
+                "properties": {"name": {"type": "string"}},
+                "required": ["name"],
+            }
+        },
+    }
+    adapter = create_type_adapter(schema)
+
+    value = {"tag": {"name": "t"}, "n": 1}
+    assert adapter.validate_python({"item": value}).item == value
+    with pytest.raises((ValidationError, ValueError)):
+        adapter.validate_python({"item": {"tag": {}, "n": 1}})
+
+
+def test_allof_object_schemas_with_clashing_renamed_fields():
+    """Branches whose renamed fields clash are validated one by one."""
+    schema = {
+        "allOf": [
+            {"type": "object", "properties": {"_x": {"type": "string"}}},
+            {
+                "type": "object",
+                "properties": {"x": {"type": "integer"}},
+                "required": ["x"],
+            },
+        ]
+    }
+    adapter = create_type_adapter(schema)
+
+    assert adapter.validate_python({"_x": "a", "x": 1}) == {"_x": "a", "x": 1}
+    with pytest.raises((ValidationError, ValueError)):
+        adapter.validate_python({"_x": "a", "x": "b"})
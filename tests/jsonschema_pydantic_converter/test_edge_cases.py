@@ -1,9 +1,12 @@
 """Test edge cases and missing coverage scenarios."""
 
+import uuid
+from datetime import date
+
 import pytest
 from pydantic import ValidationError
 
-from jsonschema_pydantic_converter import create_type_adapter
+from jsonschema_pydantic_converter import _schema_utils, create_type_adapter
 
 
 def test_not_with_non_validation_error():
@@ -549,3 +552,99 @@ def test_additional_properties_with_schema_type_validation():
     # Should reject object where additional property is not a string
     with pytest.raises(ValidationError):
         adapter.validate_python({"name": "Bob", "age": 30})
+
+
+def test_definition_containing_itself():
+    """Test that a definition nested inside itself does not loop forever."""
+    node: dict = {"type": "object", "properties": {"value": {"type": "integer"}}}
+    node["$defs"] = {"Node": node}
+    schema = {"$ref": "#/$defs/Node", "$defs": {"Node": node}}
+
+    namespace: dict = {}
+    adapter = create_type_adapter(schema, _namespace=namespace)
+
+    assert "__Node" in namespace
+    assert "__Node_Node" in namespace
+    assert adapter.validate_python({"value": 1}).value == 1
+
+
+@pytest.mark.parametrize("special", [float("nan"), float("inf"), float("-inf")])
+def test_non_finite_const_does_not_share_null_const(json_backend, special):
+    """Test that NaN/Infinity consts are not confused with a null const."""
+    schema = {
+        "type": "object",
+        "properties": {"a": {"const": special}, "b": {"const": None}},
+        "required": ["b"],
+    }
+
+    adapter = create_type_adapter(schema)
+
+    assert adapter.validate_python({"b": None}).b is None
+    assert adapter.json_schema()["properties"]["b"]["const"] is None
+
+
+@pytest.mark.parametrize(
+    "value",
+    [uuid.UUID("12345678-1234-5678-1234-567812345678"), date(2020, 1, 1)],
+    ids=["uuid", "date"],
+)
+def test_non_json_const_does_not_share_string_const(json_backend, value):
+    """Test that UUID/date consts and enums are not confused with strings."""
+    schema = {
+        "type": "object",
+        "properties": {
+            "a": {"const": value},
+            "b": {"const": str(value)},
+            "c": {"enum": [value]},
+            "d": {"enum": [str(value)]},
+        },
+    }
+
+    adapter = create_type_adapter(schema)
+
+    assert adapter.validate_python({"b": str(value)}).b == str(value)
+    assert adapter.validate_python({"d": str(value)}).d.value == str(value)
+
+
+def test_big_int_const_keeps_its_own_key(json_backend):
+    """Test that consts beyond 64 bits are still told apart."""
+    schema = {
+        "type": "object",
+        "properties": {"a": {"const": 2**64}, "b": {"const": 2**64 + 1}},
+    }
+
+    adapter = create_type_adapter(schema)
+
+    assert adapter.validate_python({"a": 2**64, "b": 2**64 + 1}).b == 2**64 + 1
+
+
+def test_consts_with_equal_json_encoding_are_not_shared():
+    """Test that consts differing only in non-JSON types stay distinct."""
+    schema = {
+        "type": "object",
+        "properties": {
+            "a": {"const": (1, 2)},
+            "b": {"const": [1, 2]},
+            "c": {"const": {1: "x"}},
+            "d": {"const": {"1": "x"}},
+        },
+    }
+
+    adapter = create_type_adapter(schema)
+
+    assert adapter.validate_python({"b": [1, 2]}).b == [1, 2]
+    assert adapter.validate_python({"d": {"1": "x"}}).d == {"1": "x"}
+    assert adapter.validate_python({"c": {1: "x"}}).c == {1: "x"}
+
+
+def test_schema_cache_key_only_for_json_native_values(json_backend):
+    """Test that values JSON cannot represent exactly get no cache key."""
+    cyclic: list = []
+    cyclic.append(cyclic)
+
+    assert _schema_utils.schema_cache_key({"const": [1, {"a": None}]}) is not None
+    assert _schema_utils.schema_cache_key({"const": cyclic}) is None
+    assert _schema_utils.schema_cache_key({"const": float("nan")}) is None
+    assert _schema_utils.schema_cache_key({"const": True}) != (
+        _schema_utils.schema_cache_key({"const": 1})
+    )
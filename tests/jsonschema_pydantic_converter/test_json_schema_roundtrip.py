@@ -130,6 +130,27 @@ def test_object_with_properties_json_schema():
     assert "name" in generated["required"]
 
 
+def test_optional_nullable_properties_json_schema():
+    """Test optional properties that already accept null are not re-wrapped."""
+    schema = {
+        "type": "object",
+        "properties": {
+            "anything": {},
+            "maybe_name": {"anyOf": [{"type": "string"}, {"type": "null"}]},
+        },
+    }
+
+    adapter = create_type_adapter(schema)
+    generated = adapter.json_schema()
+
+    assert "anyOf" not in generated["properties"]["anything"]
+    assert generated["properties"]["maybe_name"]["anyOf"] == [
+        {"type": "string"},
+        {"type": "null"},
+    ]
+    assert adapter.validate_python({"anything": None, "maybe_name": None})
+
+
 def test_nested_object_json_schema():
     """Test nested object structures."""
     schema = {
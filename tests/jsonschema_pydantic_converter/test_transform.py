@@ -530,3 +530,10 @@ def test_cross_def_models_are_complete():
     # This triggers schema generation on CopiedModel, which traverses into
     # the Parent model. If Parent is incomplete, auto-rebuild will fail.
     CopiedModel.model_json_schema()
+
+
+def test_transform_schema_as_json_text():
+    """Test that transform accepts a schema encoded as JSON."""
+    model = transform('{"type": "object", "properties": {"name": {"type": "string"}}}')
+
+    assert model(name="Alice").name == "Alice"